@@ -5,11 +5,13 @@ from __future__ import annotations
 
 import asyncio
 import graphlib
+import inspect
 import logging
-import sys
 import time
+from collections import Counter
+from collections.abc import Awaitable, Callable, Set
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from typing_extensions import Self
@@ -26,12 +28,34 @@ from sgn.base import (
 )
 from sgn.groups import ElementGroup, PadSelection
 from sgn.logger import configure_sgn_logging
-from sgn.profile import async_sgn_mem_profile
+from sgn.profile import async_sgn_mem_profile, sgn_mem_profile
 from sgn.visualize import visualize
 
 logger = logging.getLogger("sgn.pipeline")
 
 
+def _bind_pad_call(pad: Pad) -> tuple[Pad, Callable[[], Any], bool]:
+    """Bind the method that executes a pad and whether it must be awaited.
+
+    Pads with coroutine call functions are bound to call_async(), or to __call__
+    where a subclass overrides it as a coroutine.
+    """
+    if not pad.is_async:
+        return pad, pad.__call__, False
+    if inspect.iscoroutinefunction(pad.__call__):
+        return pad, pad.__call__, True
+    return pad, pad.call_async, True
+
+
+async def _await_pad(pad: Pad, call: Callable[[], Awaitable[Any]]) -> None:
+    """Await a pad's coroutine call, naming the pad in any error it raises."""
+    try:
+        await call()
+    except Exception as e:
+        msg = f"(from pad '{pad.name}'): {e}."
+        raise type(e)(msg) from e
+
+
 class Graph:
     """Base class for managing element graphs and pad registries.
 
@@ -45,7 +69,7 @@ class Graph:
     def __init__(self) -> None:
         """Initialize an empty graph with registry and element tracking."""
         self._registry: dict[str, Pad | Element] = {}
-        self.graph: dict[Pad, set[Pad]] = {}
+        self.graph: dict[Pad, Set[Pad]] = {}
         self.elements: list[Element] = []
 
     def __getitem__(self, name: str) -> Pad | Element:
@@ -68,11 +92,16 @@ class Graph:
             element.name not in self._registry
         ), f"Element name '{element.name}' is already in use in this graph"
         self._registry[element.name] = element
-        for pad in element.pad_list:
-            assert (
-                pad.name not in self._registry
-            ), f"Pad name '{pad.name}' is already in use in this graph"
-            self._registry[pad.name] = pad
+        pad_list = element.pad_list
+        pads = {pad.name: pad for pad in pad_list}
+        # pads sharing a name within the element collapse into one entry above
+        assert len(pads) == len(pad_list), (
+            "Pad name '%s' is already in use in this graph"
+            % min(n for n, c in Counter(p.name for p in pad_list).items() if c > 1)
+        )
+        in_use = self._registry.keys() & pads
+        assert not in_use, f"Pad name '{min(in_use)}' is already in use in this graph"
+        self._registry.update(pads)
         self.graph.update(element.graph)
         self.elements.append(element)
 
@@ -278,27 +307,83 @@ class Pipeline(Graph):
 
     These tasks are grouped using Pads and Elements. The Pipeline class is responsible
     for registering methods to produce source, transform and sink elements and to
-    assemble those elements in a directed acyclic graph. It also establishes an event
-    loop to execute the graph asynchronously.
+    assemble those elements in a directed acyclic graph. If any pad has a coroutine
+    call function, run() executes the graph in an event loop.
     """
 
     def __init__(self) -> None:
         """Class to establish and execute a graph of elements that will process frames.
 
         Registers methods to produce source, transform and sink elements and to assemble
-        those elements in a directed acyclic graph. Also establishes an event loop.
+        those elements in a directed acyclic graph.
         """
         super().__init__()
-        self.loop = asyncio.get_event_loop()
         self.__loop_counter = 0
         self.sinks: dict[str, SinkElement] = {}
+        self._execution_order: tuple[tuple[Pad, ...], ...] | None = None
+        self._execution_calls: (
+            tuple[tuple[tuple[Pad, Callable[[], Any], bool], ...], ...] | None
+        ) = None
 
     def _insert_element(self, element: Element) -> None:
         """Insert element and track sink elements."""
         super()._insert_element(element)
+        self._execution_order = None
+        self._execution_calls = None
         if isinstance(element, SinkElement):
             self.sinks[element.name] = element
 
+    def link(self, link_map: dict[str | SinkPad, str | SourcePad]) -> Self:
+        """Link pads in the pipeline, invalidating the cached execution order."""
+        self._execution_order = None
+        self._execution_calls = None
+        return super().link(link_map)
+
+    def _compile_execution_order(self) -> tuple[tuple[Pad, ...], ...]:
+        """Return the pads in the graph grouped into topological generations,
+        computing them once.
+
+        Pads within a generation do not depend on each other. The result is cached
+        until the graph is modified by insert() or link(), so the sort is not
+        repeated on every graph loop.
+
+        Returns:
+            tuple[tuple[Pad, ...], ...], the generations of pads in the order they
+            are executed
+        """
+        if self._execution_order is None:
+            ts = graphlib.TopologicalSorter(self.graph)
+            ts.prepare()
+            generations = []
+            while ts.is_active():
+                nodes = ts.get_ready()
+                generations.append(nodes)
+                ts.done(*nodes)
+            self._execution_order = tuple(generations)
+        return self._execution_order
+
+    def _compile_execution_calls(
+        self,
+    ) -> tuple[tuple[tuple[Pad, Callable[[], Any], bool], ...], ...]:
+        """Return the pad generations together with the pads' bound calls.
+
+        The bound method is looked up once per graph rather than once per pad on
+        every graph loop. Pads with coroutine call functions are bound to
+        call_async(), or to __call__ where a subclass overrides it as a
+        coroutine, and flagged so the graph loop knows to await them.
+
+        Returns:
+            tuple[tuple[tuple[Pad, Callable, bool], ...], ...], for each pad in each
+            generation, the pad, the callable that executes it and whether it must
+            be awaited
+        """
+        if self._execution_calls is None:
+            self._execution_calls = tuple(
+                tuple(_bind_pad_call(pad) for pad in generation)
+                for generation in self._compile_execution_order()
+            )
+        return self._execution_calls
+
     def nodes(self, pads: bool = True, intra: bool = False) -> tuple[str, ...]:
         """Get the nodes in the pipeline.
 
@@ -406,32 +491,57 @@ class Pipeline(Graph):
 
     @async_sgn_mem_profile(logger)
     async def __execute_graph_loop(self) -> None:
-        async def _partial(node):
-            try:
-                return await node()
-            except Exception as e:
-                exc_type, exc_value, exc_traceback = sys.exc_info()
-                msg = f"(from pad '{node.name}'): {exc_value}."
-                raise exc_type(msg) from e
-
         self.__loop_counter += 1
         logger.info("Executing graph loop %s:", self.__loop_counter)
-        ts = graphlib.TopologicalSorter(self.graph)
-        ts.prepare()
-        while ts.is_active():
-            # concurrently execute the next batch of ready nodes
-            nodes = ts.get_ready()
-            tasks = [
-                self.loop.create_task(_partial(node)) for node in nodes  # type: ignore # noqa: E501
-            ]
-            await asyncio.gather(*tasks)
-            ts.done(*nodes)
+        for generation in self._compile_execution_calls():
+            # plain pads are called inline; pads with coroutine calls in the same
+            # generation are independent, so they are awaited concurrently
+            pending = []
+            for node, call, is_async in generation:
+                if is_async:
+                    pending.append((node, call))
+                    continue
+                try:
+                    call()
+                except Exception as e:
+                    msg = f"(from pad '{node.name}'): {e}."
+                    raise type(e)(msg) from e
+            if len(pending) == 1:
+                await _await_pad(*pending[0])
+            elif pending:
+                await asyncio.gather(*(_await_pad(*item) for item in pending))
 
     async def _execute_graphs(self) -> None:
         """Async graph execution function."""
 
-        while not all(sink.at_eos for sink in self.sinks.values()):
-            await self.__execute_graph_loop()
+        # EOS is final, so wait on one sink at a time rather than checking every
+        # sink on every graph loop
+        for sink in self.sinks.values():
+            while not sink.at_eos:
+                await self.__execute_graph_loop()
+
+    @sgn_mem_profile(logger)
+    def __execute_graph_loop_sync(self) -> None:
+        self.__loop_counter += 1
+        logger.info("Executing graph loop %s:", self.__loop_counter)
+        for generation in self._compile_execution_calls():
+            for node, call, _ in generation:
+                try:
+                    call()
+                except Exception as e:
+                    msg = f"(from pad '{node.name}'): {e}."
+                    raise type(e)(msg) from e
+
+    def _execute_graphs_sync(self) -> None:
+        """Graph execution function for pipelines without coroutine pads.
+
+        No event loop is involved, so there is no scheduling overhead per graph
+        loop.
+        """
+
+        for sink in self.sinks.values():
+            while not sink.at_eos:
+                self.__execute_graph_loop_sync()
 
     def check(self) -> None:
         """Check that pipeline elements are connected.
@@ -453,6 +563,34 @@ class Pipeline(Graph):
                     msg = f"Sink pad not linked: {sink_pad}"
                     raise RuntimeError(msg)
 
+    def _run_in_new_loop(self) -> None:
+        """Execute the graphs in a fresh event loop that is closed afterwards.
+
+        The loop is private to this call so repeated runs do not depend on, or
+        leave behind, a global event loop.
+        """
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(self._execute_graphs())
+        finally:
+            loop.close()
+
+    def _run_async(self) -> None:
+        """Execute the graphs in an event loop, for pipelines with coroutine pads."""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            self._run_in_new_loop()
+        else:
+            """If the event loop is running, e.g., running in a Jupyter
+            Notebook, run the pipeline in a forked thread.
+            """
+            import threading
+
+            thread = threading.Thread(target=self._run_in_new_loop)
+            thread.start()
+            thread.join()
+
     def run(self, auto_parallelize: bool = True) -> None:
         """Run the pipeline until End Of Stream (EOS)
 
@@ -475,21 +613,13 @@ class Pipeline(Graph):
         # Run normally without parallelization
         self.check()
         __start = time.time()
-        if not self.loop.is_running():
-            self.loop.run_until_complete(self._execute_graphs())
+        if any(
+            is_async
+            for generation in self._compile_execution_calls()
+            for _, _, is_async in generation
+        ):
+            self._run_async()
         else:
-            """If the event loop is running, e.g., running in a Jupyter
-            Notebook, run the pipeline in a forked thread.
-            """
-            import threading
-
-            def _run_in_fork(pipeline):
-                pipeline.loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(pipeline.loop)
-                pipeline.loop.run_until_complete(pipeline._execute_graphs())
-                pipeline.loop.close()
-
-            thread = threading.Thread(target=_run_in_fork, args=(self,))
-            thread.start()
-            thread.join()
+            # no pad has a coroutine call function, so no event loop is needed
+            self._execute_graphs_sync()
         logger.info("Pipeline().run() executed in %s seconds", (time.time() - __start))
@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import inspect
+import itertools
 import logging
-import uuid
+import os
 from abc import ABC, abstractmethod
-from collections.abc import Callable, Sequence
+from collections.abc import Callable, Sequence, Set
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import ClassVar, Generic, TypeVar
 
 from .frames import DataSpec, Frame
@@ -15,16 +18,28 @@ FrameLike = TypeVar("FrameLike", bound=Frame)
 
 logger = logging.getLogger("sgn")
 
+# source of process-local unique ids, see UniqueID
+_id_counter = itertools.count()
 
-@dataclass
+
+@dataclass(slots=True, eq=False)
 class UniqueID:
     """Generic class from which all classes that participate in an execution graph
-    should be derived. Enforces a unique name and hashes based on that name.
+    should be derived. Enforces a unique name and hashes by identity.
 
     Args:
         name:
             str, optional, The unique name for this object, defaults to the objects
-            unique uuid4 hex string if not specified
+            unique hex id string if not specified
+
+    Notes:
+        Hashing:
+            Pads are used as keys throughout the execution graph, so UniqueID
+            keeps object's identity-based __hash__ and __eq__, which are
+            implemented in C, rather than defining them in Python. Since every
+            object gets its own id, identity and id equality coincide. The hash
+            is not stable across python sessions, and should not be used for
+            checksum purposes.
     """
 
     name: str = ""
@@ -32,34 +47,12 @@ class UniqueID:
 
     def __post_init__(self):
         """Handle setup of the UniqueID class, including the `._id` attribute."""
-        # give every element a truly unique identifier
-        self._id = uuid.uuid4().hex
+        # give every element a truly unique identifier: the process id keeps ids
+        # unique across Parallelize workers, the counter within a process
+        self._id = f"{os.getpid():08x}{next(_id_counter):x}"
         if not self.name:
             self.name = self._id
 
-    def __hash__(self) -> int:
-        """Compute the hash of the object based on the unique id.
-
-        Notes:
-            Motivation:
-                we need the Base class to be hashable, so that it can be
-                used as a key in a dictionary, but mutable dataclasses are not
-                hashable by default, so we have to define our own hash function
-                here.
-            Stability:
-                As currently implemented, the hash of a UniqueID object will not be
-                stable across python sessions, and should therefore not be used for
-                checksum purposes.
-
-        Returns:
-            int, hash of the object
-        """
-        return hash(self._id)
-
-    def __eq__(self, other) -> bool:
-        """Check if two objects are equal based on their unique id and types."""
-        return hash(self) == hash(other)
-
 
 @dataclass(eq=False, repr=False)
 class PadLike(ABC):
@@ -72,6 +65,13 @@ class PadLike(ABC):
     function that will be executed when the pad is called. The call function
     must take a pad as an argument, e.g., def call(pad):
 
+    The call function may also be a coroutine function, e.g., async def
+    call(pad):, in which case the pad is marked with is_async and must be
+    awaited through call_async() rather than called directly.
+
+    Subclasses that override __call__ with an async def are also marked with
+    is_async, and the pipeline awaits their override.
+
     Developers should not subclass or use Pad directly. Instead use SourcePad
     or SinkPad.
 
@@ -83,16 +83,27 @@ class PadLike(ABC):
             this pad
     """
 
+    # storage for the fields below is provided by the concrete pad classes
+    __slots__ = ()
+
     element: Element
     call: Callable
     is_linked: bool = False
+    pad_name: str = field(init=False)
+    is_async: bool = field(init=False)
 
     def __post_init__(self):
         self.pad_name = self.name
         self.name = f"{self.element.name}:{self.pad_type}:{self.pad_name}"
+        # determine once whether the pad must be awaited, either because its
+        # call function is a coroutine or because a subclass overrides __call__
+        # as a coroutine
+        self.is_async = inspect.iscoroutinefunction(
+            self.call
+        ) or inspect.iscoroutinefunction(type(self).__call__)
 
     @abstractmethod
-    async def __call__(self) -> None:
+    def __call__(self) -> None:
         """The call method for a pad must be implemented by the element that the pad
         belongs to.
 
@@ -100,6 +111,11 @@ class PadLike(ABC):
         """
         ...
 
+    @abstractmethod
+    async def call_async(self) -> None:
+        """The asynchronous counterpart of __call__, used when is_async is set."""
+        ...
+
     @property
     @abstractmethod
     def pad_type(self) -> str:
@@ -107,7 +123,7 @@ class PadLike(ABC):
         ...
 
 
-@dataclass(eq=False, repr=False)
+@dataclass(eq=False, repr=False, slots=True)
 class SourcePad(UniqueID, PadLike):
     """A pad that provides a data Frame when called.
 
@@ -134,16 +150,24 @@ class SourcePad(UniqueID, PadLike):
     def pad_type(self) -> str:
         return "src"
 
-    async def __call__(self) -> None:
+    def __call__(self) -> None:
         """When called, a source pad receives a Frame from the element that the pad
         belongs to."""
-        self.output = self.call(pad=self)
-        assert isinstance(self.output, Frame)
-        if self.element is not None:
-            self.element.logger.info("\t%s : %s", self, self.output)
+        self._set_output(self.call(pad=self))
 
+    async def call_async(self) -> None:
+        """Await the element's call function and receive the Frame it returns."""
+        self._set_output(await self.call(pad=self))
 
-@dataclass(eq=False, repr=False)
+    def _set_output(self, output: Frame) -> None:
+        self.output = output
+        assert isinstance(output, Frame)
+        element = self.element
+        if element is not None:
+            element.logger.info("\t%s : %s", self, output)
+
+
+@dataclass(eq=False, repr=False, slots=True)
 class SinkPad(UniqueID, PadLike):
     """A pad that receives a data Frame when called.  When linked, it returns a
     dictionary suitable for building a graph in graphlib.
@@ -180,7 +204,7 @@ class SinkPad(UniqueID, PadLike):
     def pad_type(self) -> str:
         return "snk"
 
-    def link(self, other: SourcePad) -> dict[Pad, set[Pad]]:
+    def link(self, other: SourcePad) -> dict[Pad, Set[Pad]]:
         """Returns a dictionary of dependencies suitable for adding to a graphlib graph.
 
         Args:
@@ -193,16 +217,16 @@ class SinkPad(UniqueID, PadLike):
                 source pad, but multiple sink pads may link to the same source pad.
 
         Returns:
-            dict[SinkPad, set[SourcePad]], a dictionary of dependencies suitable for
-            adding to a graphlib graph
+            dict[SinkPad, frozenset[SourcePad]], a dictionary of dependencies
+            suitable for adding to a graphlib graph
         """
         assert isinstance(other, SourcePad), "other is not an instance of SourcePad"
         self.other = other
         self.is_linked = True
         other.is_linked = True
-        return {self: {other}}
+        return {self: frozenset((other,))}
 
-    async def __call__(self) -> None:
+    def __call__(self) -> None:
         """When called, a sink pad gets a Frame from the linked source pad and then
         calls the element's provided call function.
 
@@ -213,24 +237,43 @@ class SinkPad(UniqueID, PadLike):
                 within a directed acyclic graph such as those provided by the
                 apps.Pipeline class.
         """
-        assert isinstance(self.other, SourcePad), "Sink pad has not been linked"
-        self.input = self.other.output
-        assert isinstance(self.input, Frame)
-        if self.data_spec is None:
-            self.data_spec = self.input.spec
-        if not self.data_spec == self.input.spec:
+        frame = self._get_input()
+        self.call(self, frame)
+        element = self.element
+        if element is not None:
+            element.logger.info("\t%s:%s", self, frame)
+
+    async def call_async(self) -> None:
+        """Get a Frame from the linked source pad and await the element's call
+        function with it."""
+        frame = self._get_input()
+        await self.call(self, frame)
+        element = self.element
+        if element is not None:
+            element.logger.info("\t%s:%s", self, frame)
+
+    def _get_input(self) -> Frame:
+        """Take the Frame from the linked source pad, validating its data spec."""
+        # link() has already checked the type of the source pad
+        other = self.other
+        assert other is not None, "Sink pad has not been linked"
+        frame = self.input = other.output
+        assert isinstance(frame, Frame)
+        spec = frame.spec
+        data_spec = self.data_spec
+        if data_spec is None:
+            self.data_spec = spec
+        elif not data_spec == spec:
             msg = (
                 f"frame received by {self.name} is inconsistent with "
                 "previously received frames. previous data specification: "
-                f"{self.data_spec}, current data specification: {self.input.spec}"
+                f"{data_spec}, current data specification: {spec}"
             )
             raise ValueError(msg)
-        self.call(self, self.input)
-        if self.element is not None:
-            self.element.logger.info("\t%s:%s", self, self.input)
+        return frame
 
 
-@dataclass(eq=False, repr=False)
+@dataclass(eq=False, repr=False, slots=True)
 class InternalPad(UniqueID, PadLike):
     """A pad that sits inside an element and is called between sink and source pads.
     Internal pads are connected in the elements internal graph according to the below
@@ -260,11 +303,15 @@ class InternalPad(UniqueID, PadLike):
     def pad_type(self) -> str:
         return "inl"
 
-    async def __call__(self) -> None:
+    def __call__(self) -> None:
         """When called, an internal pad receives a Frame from the element that the pad
         belongs to."""
         self.call()
 
+    async def call_async(self) -> None:
+        """Await the element's internal call function."""
+        await self.call()
+
 
 @dataclass(repr=False)
 class ElementLike(UniqueID):
@@ -300,7 +347,7 @@ class ElementLike(UniqueID):
     source_pads: list[SourcePad] = field(default_factory=list)
     sink_pads: list[SinkPad] = field(default_factory=list)
     internal_pad: InternalPad = field(init=False)
-    graph: dict[Pad, set[Pad]] = field(init=False)
+    graph: dict[Pad, Set[Pad]] = field(init=False)
 
     def __post_init__(self):
         """Establish the graph attribute as an empty dictionary."""
@@ -308,28 +355,33 @@ class ElementLike(UniqueID):
         self.graph = {}
         self.internal_pad = InternalPad(name="inl", element=self, call=self.internal)
 
-    @property
+    @cached_property
     def source_pad_dict(self) -> dict[str, SourcePad]:
-        """Return a dictionary of source pads with the pad name as the key."""
+        """Return a dictionary of source pads with the pad name as the key.
+
+        Pads are fixed once the element is constructed, so this is built once.
+        """
         return {p.name: p for p in self.source_pads}
 
-    @property
+    @cached_property
     def sink_pad_dict(self) -> dict[str, SinkPad]:
-        """Return a dictionary of sink pads with the pad name as the key."""
+        """Return a dictionary of sink pads with the pad name as the key.
+
+        Pads are fixed once the element is constructed, so this is built once.
+        """
         return {p.name: p for p in self.sink_pads}
 
-    @property
+    @cached_property
     def pad_list(self) -> Sequence[Pad]:
-        """Return a list of all pads."""
-        all_pads: list[Pad] = []
-        all_pads.extend(self.source_pads)
-        all_pads.extend(self.sink_pads)
-        all_pads.append(self.internal_pad)
-        return all_pads
+        """Return a sequence of all pads, built once."""
+        return (*self.source_pads, *self.sink_pads, self.internal_pad)
 
-    @property
+    @cached_property
     def logger(self) -> logging.Logger:
-        """Return the logger scoped to this element, e.g. sgn.{name}."""
+        """Return the logger scoped to this element, e.g. sgn.{name}.
+
+        The logger is looked up once; pads log through it on every call.
+        """
         return logger.getChild(self.name)
 
     def internal(self) -> None:
@@ -394,11 +446,13 @@ class SourceElement(ABC, ElementLike):
             for pad_name in self.source_pad_names
         ]
         # short names for easier recall
-        self.srcs = {n: p for n, p in zip(self.source_pad_names, self.source_pads)}
-        self.rsrcs = {p: n for n, p in zip(self.source_pad_names, self.source_pads)}
+        self.srcs = dict(zip(self.source_pad_names, self.source_pads))
+        self.rsrcs = dict(zip(self.source_pads, self.source_pad_names))
         assert self.source_pads, "SourceElement must specify source pads"
         assert not self.sink_pads, "SourceElement must not specify sink pads"
-        self.graph.update({s: {self.internal_pad} for s in self.source_pads})
+        self.graph.update(
+            dict.fromkeys(self.source_pads, frozenset((self.internal_pad,)))
+        )
 
     @abstractmethod
     def new(self, pad: SourcePad) -> Frame:
@@ -500,19 +554,21 @@ class TransformElement(ABC, ElementLike, Generic[FrameLike]):
             for pad_name in self.sink_pad_names
         ]
         # short names for easier recall
-        self.srcs = {n: p for n, p in zip(self.source_pad_names, self.source_pads)}
-        self.snks = {n: p for n, p in zip(self.sink_pad_names, self.sink_pads)}
-        self.rsrcs = {p: n for n, p in zip(self.source_pad_names, self.source_pads)}
-        self.rsnks = {p: n for n, p in zip(self.sink_pad_names, self.sink_pads)}
+        self.srcs = dict(zip(self.source_pad_names, self.source_pads))
+        self.snks = dict(zip(self.sink_pad_names, self.sink_pads))
+        self.rsrcs = dict(zip(self.source_pads, self.source_pad_names))
+        self.rsnks = dict(zip(self.sink_pads, self.sink_pad_names))
         assert (
             self.source_pads and self.sink_pads
         ), "TransformElement must specify both sink and source pads"
 
         # Make maximal bipartite graph in two pieces
         # First, (all sinks -> internal)
-        self.graph.update({self.internal_pad: set(self.sink_pads)})
+        self.graph[self.internal_pad] = frozenset(self.sink_pads)
         # Second, (internal -> all sources)
-        self.graph.update({s: {self.internal_pad} for s in self.source_pads})
+        self.graph.update(
+            dict.fromkeys(self.source_pads, frozenset((self.internal_pad,)))
+        )
 
     @abstractmethod
     def pull(self, pad: SinkPad, frame: FrameLike) -> None:
@@ -595,15 +651,17 @@ class SinkElement(ABC, ElementLike, Generic[FrameLike]):
             for pad_name in self.sink_pad_names
         ]
         # short names for easier recall
-        self.snks = {n: p for n, p in zip(self.sink_pad_names, self.sink_pads)}
-        self.rsnks = {p: n for n, p in zip(self.sink_pad_names, self.sink_pads)}
-        self._at_eos = {p: False for p in self.sink_pads}
+        self.snks = dict(zip(self.sink_pad_names, self.sink_pads))
+        self.rsnks = dict(zip(self.sink_pads, self.sink_pad_names))
+        # EOS flags are kept as one bit per sink pad, in sink pad order
+        self._eos_idx = {p: i for i, p in enumerate(self.sink_pads)}
+        self._eos_mask = 0
         assert self.sink_pads, "SinkElement must specify sink pads"
         assert not self.source_pads, "SinkElement must not specify any source pads"
         self.sink_pad_names_full = [p.name for p in self.sink_pads]
 
         # Update graph to be (all sinks -> internal)
-        self.graph.update({self.internal_pad: set(self.sink_pads)})
+        self.graph[self.internal_pad] = frozenset(self.sink_pads)
 
     @property
     def at_eos(self) -> bool:
@@ -614,7 +672,7 @@ class SinkElement(ABC, ElementLike, Generic[FrameLike]):
             bool, True if any sink pad is at EOS, False otherwise
         """
         # TODO generalize this to be able to choose any v. all EOS propagation
-        return any(self._at_eos.values())
+        return self._eos_mask != 0
 
     def mark_eos(self, pad: SinkPad) -> None:
         """Marks a sink pad as receiving the End of Stream (EOS). The EOS marker signals
@@ -624,7 +682,7 @@ class SinkElement(ABC, ElementLike, Generic[FrameLike]):
             pad:
                 SinkPad, The sink pad that is receiving the
         """
-        self._at_eos[pad] = True
+        self._eos_mask |= 1 << self._eos_idx[pad]
 
     @abstractmethod
     def pull(self, pad: SinkPad, frame: FrameLike) -> None:
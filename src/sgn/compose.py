@@ -188,8 +188,8 @@ class ComposedSourceElement(ComposedElementMixin, SourceElement):
             SourcePad(name=pad_name, element=self, call=self.new)
             for pad_name in self.source_pad_names
         ]
-        self.srcs = {n: p for n, p in zip(self.source_pad_names, self.source_pads)}
-        self.rsrcs = {p: n for n, p in zip(self.source_pad_names, self.source_pads)}
+        self.srcs = dict(zip(self.source_pad_names, self.source_pads))
+        self.rsrcs = dict(zip(self.source_pads, self.source_pad_names))
 
         if not self.source_pads:  # pragma: no cover
             raise ValueError("ComposedSourceElement must have at least one source pad")
@@ -199,11 +199,13 @@ class ComposedSourceElement(ComposedElementMixin, SourceElement):
         self.graph.update(self._internal_graph.graph)
 
         # 2. Composed internal_pad depends on internal boundary source pads
-        internal_boundary_srcs = set(self._boundary_source_pads.values())
+        internal_boundary_srcs = frozenset(self._boundary_source_pads.values())
         self.graph[self.internal_pad] = internal_boundary_srcs
 
         # 3. Composed source pads depend on composed internal_pad
-        self.graph.update({s: {self.internal_pad} for s in self.source_pads})
+        self.graph.update(
+            dict.fromkeys(self.source_pads, frozenset((self.internal_pad,)))
+        )
 
     @property
     def pad_list(self) -> list[Pad]:
@@ -305,10 +307,10 @@ class ComposedTransformElement(ComposedElementMixin, TransformElement):
             for pad_name in self.source_pad_names
         ]
 
-        self.srcs = {n: p for n, p in zip(self.source_pad_names, self.source_pads)}
-        self.snks = {n: p for n, p in zip(self.sink_pad_names, self.sink_pads)}
-        self.rsrcs = {p: n for n, p in zip(self.source_pad_names, self.source_pads)}
-        self.rsnks = {p: n for n, p in zip(self.sink_pad_names, self.sink_pads)}
+        self.srcs = dict(zip(self.source_pad_names, self.source_pads))
+        self.snks = dict(zip(self.sink_pad_names, self.sink_pads))
+        self.rsrcs = dict(zip(self.source_pads, self.source_pad_names))
+        self.rsnks = dict(zip(self.sink_pads, self.sink_pad_names))
 
         if not self.source_pads or not self.sink_pads:  # pragma: no cover
             raise ValueError(
@@ -328,14 +330,16 @@ class ComposedTransformElement(ComposedElementMixin, TransformElement):
         # 3. Virtual sources depend on composed sink pads
         for snk_name, virtual_src in self._virtual_sources.items():
             composed_snk = self.snks[snk_name]
-            self.graph[virtual_src] = {composed_snk}
+            self.graph[virtual_src] = frozenset((composed_snk,))
 
         # 4. Composed internal_pad depends on internal boundary source pads
-        internal_boundary_srcs = set(self._boundary_source_pads.values())
+        internal_boundary_srcs = frozenset(self._boundary_source_pads.values())
         self.graph[self.internal_pad] = internal_boundary_srcs
 
         # 5. Composed source pads depend on composed internal_pad
-        self.graph.update({s: {self.internal_pad} for s in self.source_pads})
+        self.graph.update(
+            dict.fromkeys(self.source_pads, frozenset((self.internal_pad,)))
+        )
 
     @property
     def pad_list(self) -> list[Pad]:
@@ -447,9 +451,10 @@ class ComposedSinkElement(ComposedElementMixin, SinkElement):
             )
             self._virtual_sources[snk_name] = virtual_src
 
-        self.snks = {n: p for n, p in zip(self.sink_pad_names, self.sink_pads)}
-        self.rsnks = {p: n for n, p in zip(self.sink_pad_names, self.sink_pads)}
-        self._at_eos = {p: False for p in self.sink_pads}
+        self.snks = dict(zip(self.sink_pad_names, self.sink_pads))
+        self.rsnks = dict(zip(self.sink_pads, self.sink_pad_names))
+        self._eos_idx = {p: i for i, p in enumerate(self.sink_pads)}
+        self._eos_mask = 0
 
         if not self.sink_pads:  # pragma: no cover
             raise ValueError("ComposedSinkElement must have at least one sink pad")
@@ -469,11 +474,13 @@ class ComposedSinkElement(ComposedElementMixin, SinkElement):
         # 3. Virtual sources depend on composed sink pads
         for snk_name, virtual_src in self._virtual_sources.items():
             composed_snk = self.snks[snk_name]
-            self.graph[virtual_src] = {composed_snk}
+            self.graph[virtual_src] = frozenset((composed_snk,))
 
         # 4. Composed internal_pad depends on all internal sinks' internal_pads
         # This ensures composed element waits for all internal sinks to complete
-        internal_sink_pads = {sink.internal_pad for sink in self._internal_sinks}
+        internal_sink_pads = frozenset(
+            sink.internal_pad for sink in self._internal_sinks
+        )
         self.graph[self.internal_pad] = internal_sink_pads
 
     @property
@@ -495,7 +502,7 @@ class ComposedSinkElement(ComposedElementMixin, SinkElement):
         """Return True when all internal sinks are at EOS."""
         if self._internal_sinks:
             return all(sink.at_eos for sink in self._internal_sinks)
-        return any(self._at_eos.values())  # pragma: no cover
+        return self._eos_mask != 0  # pragma: no cover
 
     def pull(self, pad: SinkPad, frame: Frame) -> None:
         """Inject frame into virtual source for internal boundary sink."""
@@ -21,7 +21,7 @@ class DataSpec:
         return replace(self, **kwargs)
 
 
-@dataclass
+@dataclass(slots=True)
 class Frame:
     """Generic class to hold the basic unit of data that flows through a graph.
 
@@ -40,7 +40,8 @@ class Frame:
 
     EOS: bool = False
     is_gap: bool = False
-    spec: DataSpec = field(default_factory=DataSpec)
+    # DataSpec is frozen, so frames can share one default instance
+    spec: DataSpec = DataSpec()
     data: Any = None
     metadata: dict = field(default_factory=dict)
 
@@ -48,7 +49,7 @@ class Frame:
         pass
 
 
-@dataclass
+@dataclass(slots=True)
 class IterFrame(Frame):
     """A frame whose data attribute is an iterable.
 
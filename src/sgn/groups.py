@@ -7,6 +7,7 @@ for flexible and intuitive pipeline construction.
 
 from __future__ import annotations
 
+from collections.abc import Sequence, Set
 from dataclasses import dataclass, field
 from typing import Iterator, Protocol, overload
 
@@ -42,6 +43,8 @@ class PadProvider(Protocol):
 class PadIteratorMixin:
     """Mixin class that provides iteration methods for pad selections."""
 
+    __slots__ = ()
+
     def select_by_source(self: PadProvider) -> Iterator[tuple[str, PadSelection]]:
         """Iterate over source pads, yielding (pad_name, single_pad_selection) tuples.
 
@@ -71,7 +74,7 @@ class PadIteratorMixin:
             yield pad_name, PadSelection(element=pad.element, pad_names={pad_name})
 
 
-@dataclass
+@dataclass(slots=True)
 class PadSelection(PadIteratorMixin):
     """Represents a selection of specific pads from an element.
 
@@ -80,49 +83,43 @@ class PadSelection(PadIteratorMixin):
     """
 
     element: Element
-    pad_names: set[str]
+    pad_names: Set[str]
+    _srcs: dict[str, SourcePad] = field(init=False, repr=False, compare=False)
+    _snks: dict[str, SinkPad] = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         """Validate that the selected pad names exist on the element."""
-        all_pad_names = set()
-
-        # Add source pad names if element has them
-        if isinstance(self.element, (SourceElement, TransformElement)):
-            all_pad_names.update(self.element.srcs.keys())
+        # the selected pads are filtered once below, so the names must not change
+        self.pad_names = frozenset(self.pad_names)
 
-        # Add sink pad names if element has them
-        if isinstance(self.element, (TransformElement, SinkElement)):
-            all_pad_names.update(self.element.snks.keys())
+        # sink elements have no srcs and source elements no snks
+        srcs: dict[str, SourcePad] = getattr(self.element, "srcs", {})
+        snks: dict[str, SinkPad] = getattr(self.element, "snks", {})
 
-        invalid_names = self.pad_names - all_pad_names
+        invalid_names = {
+            name for name in self.pad_names if name not in srcs and name not in snks
+        }
         if invalid_names:
+            all_pad_names = srcs.keys() | snks.keys()
             msg = (
                 f"Pad names {invalid_names} not found on element '{self.element.name}'"
                 f" Pad names available: {all_pad_names}"
             )
             raise ValueError(msg)
 
+        # the element's pads are fixed, so filter them once
+        self._srcs = {name: pad for name, pad in srcs.items() if name in self.pad_names}
+        self._snks = {name: pad for name, pad in snks.items() if name in self.pad_names}
+
     @property
     def srcs(self) -> dict[str, SourcePad]:
         """Extract selected source pads from the element using names as keys."""
-        if isinstance(self.element, (SourceElement, TransformElement)):
-            return {
-                name: pad
-                for name, pad in self.element.srcs.items()
-                if name in self.pad_names
-            }
-        return {}
+        return self._srcs
 
     @property
     def snks(self) -> dict[str, SinkPad]:
         """Extract selected sink pads from the element using names as keys."""
-        if isinstance(self.element, (TransformElement, SinkElement)):
-            return {
-                name: pad
-                for name, pad in self.element.snks.items()
-                if name in self.pad_names
-            }
-        return {}
+        return self._snks
 
     @property
     def elements(self) -> list[Element]:
@@ -130,7 +127,7 @@ class PadSelection(PadIteratorMixin):
         return [self.element]
 
 
-@dataclass
+@dataclass(slots=True)
 class ElementGroup(PadIteratorMixin):
     """A unified group for elements and pad selections.
 
@@ -155,11 +152,10 @@ class ElementGroup(PadIteratorMixin):
             else:
                 # For elements, get all their pad names
                 element = item
-                available_pads = set()
-                if isinstance(element, (SourceElement, TransformElement)):
-                    available_pads.update(element.srcs.keys())
-                if isinstance(element, (TransformElement, SinkElement)):
-                    available_pads.update(element.snks.keys())
+                available_pads = (
+                    getattr(element, "srcs", {}).keys()
+                    | getattr(element, "snks", {}).keys()
+                )
 
             # Find intersection of available pads with requested pad names
             matching_pads = available_pads & pad_names_set
@@ -173,56 +169,56 @@ class ElementGroup(PadIteratorMixin):
     @property
     def elements(self) -> list[Element]:
         """Get all unique elements referenced by this group."""
-        seen = set()
-        unique_elements = []
+        # dicts keep insertion order, so this dedupes by identity in one pass
+        unique_elements: dict[int, Element] = {}
         for item in self.items:
-            if isinstance(item, PadSelection):
-                element = item.element
-            else:
-                element = item
-            element_id = id(element)
-            if element_id not in seen:
-                seen.add(element_id)
-                unique_elements.append(element)
-        return unique_elements
+            element = item.element if isinstance(item, PadSelection) else item
+            unique_elements.setdefault(id(element), element)
+        return list(unique_elements.values())
 
     @property
     def srcs(self) -> dict[str, SourcePad]:
         """Extract source pads from all items in the group using names as keys."""
-        combined_pads = {}
-
+        pairs: list[tuple[str, SourcePad]] = []
         for item in self.items:
             if isinstance(item, SinkElement):
                 msg = f"Element '{item.name}' is a SinkElement and has no source pads"
                 raise ValueError(msg)
+            pairs.extend(item.srcs.items())
 
-            for pad_name, pad in item.srcs.items():
-                if pad_name in combined_pads:
-                    msg = f"Duplicate pad name '{pad_name}' in group"
-                    raise KeyError(msg)
-                combined_pads[pad_name] = pad
-
+        # build the dict in one go; duplicates only need finding on error
+        combined_pads = dict(pairs)
+        if len(combined_pads) != len(pairs):
+            _raise_duplicate_pad_name(pairs)
         return combined_pads
 
     @property
     def snks(self) -> dict[str, SinkPad]:
         """Extract sink pads from all items in the group using names as keys."""
-        combined_pads = {}
-
+        pairs: list[tuple[str, SinkPad]] = []
         for item in self.items:
             if isinstance(item, SourceElement):
                 msg = f"Element '{item.name}' is a SourceElement and has no sink pads"
                 raise ValueError(msg)
+            pairs.extend(item.snks.items())
 
-            for pad_name, pad in item.snks.items():
-                if pad_name in combined_pads:
-                    msg = f"Duplicate pad name '{pad_name}' in group"
-                    raise KeyError(msg)
-                combined_pads[pad_name] = pad
-
+        # build the dict in one go; duplicates only need finding on error
+        combined_pads = dict(pairs)
+        if len(combined_pads) != len(pairs):
+            _raise_duplicate_pad_name(pairs)
         return combined_pads
 
 
+def _raise_duplicate_pad_name(pairs: Sequence[tuple[str, SourcePad | SinkPad]]) -> None:
+    """Raise a KeyError naming the first pad name that occurs more than once."""
+    seen = set()
+    for pad_name, _ in pairs:
+        if pad_name in seen:
+            msg = f"Duplicate pad name '{pad_name}' in group"
+            raise KeyError(msg)
+        seen.add(pad_name)
+
+
 @overload
 def select(target: Element, *pad_names: str) -> PadSelection: ...
 
@@ -262,7 +258,7 @@ def select(
     """
     match target:
         case SourceElement() | TransformElement() | SinkElement():
-            return PadSelection(element=target, pad_names=set(pad_names))
+            return PadSelection(element=target, pad_names=frozenset(pad_names))
         case PadSelection():
             # Narrow the existing selection by intersecting pad names
             new_pad_names = target.pad_names & set(pad_names)
@@ -280,6 +276,10 @@ def select(
             raise TypeError(msg)
 
 
+# items that group() holds directly rather than flattening
+_GROUPABLE_TYPES = (PadSelection, SourceElement, TransformElement, SinkElement)
+
+
 def group(*items: Element | PadSelection | ElementGroup) -> ElementGroup:
     """Create a unified group from elements, pad selections, and existing groups.
 
@@ -311,9 +311,7 @@ def group(*items: Element | PadSelection | ElementGroup) -> ElementGroup:
     all_items: list[Element | PadSelection] = []
 
     for item in items:
-        if isinstance(item, PadSelection):
-            all_items.append(item)
-        elif isinstance(item, (SourceElement, TransformElement, SinkElement)):
+        if isinstance(item, _GROUPABLE_TYPES):
             all_items.append(item)
         elif isinstance(item, ElementGroup):
             all_items.extend(item.items)
@@ -14,6 +14,7 @@ if TYPE_CHECKING:
     from tracemalloc import Snapshot, Statistic, StatisticDiff
 
 F = TypeVar("F", bound=Callable[..., Awaitable[Any]])
+G = TypeVar("G", bound=Callable[..., Any])
 
 
 SGN_FIRST_MEM_USAGE: float | None = None
@@ -71,11 +72,7 @@ def async_sgn_mem_profile(logger) -> Callable[[F], F]:
 
             if actual_wrapper is None:
                 # First call - determine which wrapper to use based on logger level
-                log_level = logger.getEffectiveLevel()
-                if (
-                    log_level <= SGN_LOG_LEVELS["MEMPROF"]
-                    and log_level != logging.NOTSET
-                ):
+                if _mem_profiling_enabled(logger):
                     actual_wrapper = profiling_wrapper
                 else:
                     actual_wrapper = no_op_wrapper
@@ -88,6 +85,58 @@ def async_sgn_mem_profile(logger) -> Callable[[F], F]:
     return decorator
 
 
+def sgn_mem_profile(logger) -> Callable[[G], G]:
+    """Decorator for synchronous functions to enable memory profiling.
+
+    This is the synchronous counterpart of async_sgn_mem_profile(); the logger
+    level is likewise only checked on the first call.
+
+    Args:
+        logger: The logger instance to use for determining profiling level and
+               outputting memory statistics.
+
+    Returns:
+        A decorator function that wraps functions with memory profiling
+        capabilities.
+    """
+
+    def decorator(func: G) -> G:
+        actual_wrapper: Callable[..., Any] | None = None
+
+        def profiling_wrapper(*args: Any, **kwargs: Any) -> Any:
+            """Memory profiling wrapper that captures and reports memory usage."""
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+            snap1 = tracemalloc.take_snapshot()
+            result = func(*args, **kwargs)
+            snap2 = tracemalloc.take_snapshot()
+            display_top(logger, snap1, snap2)
+            return result
+
+        def dynamic_wrapper(*args: Any, **kwargs: Any) -> Any:
+            """Wrapper that determines implementation on first call then delegates."""
+            nonlocal actual_wrapper
+
+            if actual_wrapper is None:
+                # First call - without profiling, call the function directly
+                if _mem_profiling_enabled(logger):
+                    actual_wrapper = profiling_wrapper
+                else:
+                    actual_wrapper = func
+
+            return actual_wrapper(*args, **kwargs)
+
+        return dynamic_wrapper  # type: ignore
+
+    return decorator
+
+
+def _mem_profiling_enabled(logger) -> bool:
+    """Whether the logger's effective level enables memory profiling."""
+    log_level = logger.getEffectiveLevel()
+    return log_level <= SGN_LOG_LEVELS["MEMPROF"] and log_level != logging.NOTSET
+
+
 def display_topstats(
     logger,
     top_stats: list[Statistic] | list[StatisticDiff],
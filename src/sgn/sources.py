@@ -58,7 +58,8 @@ class SignalEOS:
         signals is nonzero.  This can be used by developers to decide if EOS
         should be set.
         """
-        return bool(cls.rcvd_signals & cls.handled_signals)
+        # isdisjoint avoids building an intersection set on every frame
+        return not cls.rcvd_signals.isdisjoint(cls.handled_signals)
 
     def raise_signal(self, sig):
         """Raise a signal that has already been raised previously.
@@ -273,8 +274,9 @@ class IterSource(SourceElement):
         # Get the pad iterator
         assert isinstance(self.iters, dict)
         assert isinstance(self.eos_on_empty, dict)
-        pad_iter = self.iters[self.rsrcs[pad]]
-        pad_eos_on_empty = self.eos_on_empty[self.rsrcs[pad]]
+        name = self.rsrcs[pad]
+        pad_iter = self.iters[name]
+        pad_eos_on_empty = self.eos_on_empty[name]
 
         # Get data from the iterator
         data = self._get_value(pad_iter)
@@ -8,6 +8,7 @@ import multiprocessing.shared_memory
 import queue
 import threading
 import time
+import weakref
 from dataclasses import dataclass
 from typing import Any, Callable, Protocol
 
@@ -18,6 +19,16 @@ from sgn.sources import SignalEOS
 
 logger = logging.getLogger("sgn.subprocess")
 
+# Workers always use the spawn start method, taken from a private context so
+# that importing or using sgn never changes the process-wide start method
+_mp_context = multiprocessing.get_context("spawn")
+
+# Per-class cache of worker_process parameter names and defaults, so that the
+# signature is only inspected once per element class rather than per instance
+_worker_parameter_specs: weakref.WeakKeyDictionary[
+    type, tuple[tuple[str, Any], ...]
+] = weakref.WeakKeyDictionary()
+
 
 def _worker_wrapper_function(terminated, worker_class, worker_method_name, **kwargs):
     """Module-level wrapper function to avoid pickling issues.
@@ -108,8 +119,8 @@ def _worker_wrapper_function(terminated, worker_class, worker_method_name, **kwa
     finally:
         terminated.set()
         if context.should_shutdown() and not context.should_stop():
-            while not context.should_stop():
-                time.sleep(1)
+            # block until the main process signals a full stop
+            context.stop_event.wait()
         # Call the static drain method
         if hasattr(worker_class, "_drain_queues"):
             worker_class._drain_queues(
@@ -287,10 +298,6 @@ class Parallelize(SignalEOS):
         )
 
     def __enter__(self):
-        try:
-            multiprocessing.set_start_method("spawn")
-        except RuntimeError:
-            pass
         super().__enter__()
         for e in Parallelize.instance_list:
             e.worker.start()
@@ -300,32 +307,53 @@ class Parallelize(SignalEOS):
     def __exit__(self, exc_type, exc_value, exc_traceback):
         super().__exit__(exc_type, exc_value, exc_traceback)
         # rejoin all the workers
+        Parallelize._join_workers()
+        Parallelize.instance_list = []
+
+        # Clean up shared memory (only applicable for process mode)
+        if not self.use_threading:
+            Parallelize._release_shm()
+
+        Parallelize.enabled = False
+
+    @staticmethod
+    def _join_workers():
+        """Join all registered workers, killing any that outlive join_timeout."""
         for e in Parallelize.instance_list:
             if e.in_queue is not None:
                 e.in_queue.cancel_join_thread()
             if e.out_queue is not None:
                 e.out_queue.cancel_join_thread()
 
+        # all workers share one deadline, so teardown takes at most
+        # join_timeout in total rather than join_timeout per worker
+        deadline = time.monotonic() + Parallelize.join_timeout
+        for e in Parallelize.instance_list:
             if (
                 e.worker is not None
                 and hasattr(e.worker, "is_alive")
                 and e.worker.is_alive()
             ):
-                e.worker.join(Parallelize.join_timeout)
+                e.worker.join(max(deadline - time.monotonic(), 0))
                 # Only processes can be killed, threads will naturally terminate
                 if hasattr(e.worker, "kill") and e.worker.is_alive():
                     e.worker.kill()
 
-        Parallelize.instance_list = []
-
-        # Clean up shared memory (only applicable for process mode)
-        if not self.use_threading:
+    @staticmethod
+    def _release_shm():
+        """Close and unlink every registered shared memory segment."""
+        # reuse the handles from to_shm rather than reopening each segment by name
+        try:
             for d in Parallelize.shm_list:
-                multiprocessing.shared_memory.SharedMemory(name=d["name"]).unlink()
+                # a caller may still hold a view of shm.buf; the mapping is then
+                # left to be released with that view, but the name is unlinked
+                with contextlib.suppress(BufferError):
+                    d["shm"].close()
+                with contextlib.suppress(FileNotFoundError):
+                    d["shm"].unlink()
+        finally:
             Parallelize.shm_list = []
 
-        Parallelize.enabled = False
-
     @staticmethod
     def to_shm(name, bytez, **kwargs):
         """
@@ -341,7 +369,8 @@ class Parallelize(SignalEOS):
 
         Args:
             name (str): Unique identifier for the shared memory block
-            bytez (bytes or bytearray): Data to store in shared memory
+            bytez (bytes-like): Data to store in shared memory, any C-contiguous
+                object supporting the buffer protocol
             **kwargs: Additional metadata to store with the shared memory reference
 
         Returns:
@@ -358,9 +387,12 @@ class Parallelize(SignalEOS):
             shared_data = bytearray("Hello world", "utf-8")
             shm_ref = SubProcess.to_shm("example_data", shared_data)
         """
+        # view the payload as flat bytes so any C-contiguous buffer (e.g. a numpy
+        # array) is sized by its byte count and copied with a single memmove
+        src = memoryview(bytez).cast("B")
         try:
             shm = multiprocessing.shared_memory.SharedMemory(
-                name=name, create=True, size=len(bytez)
+                name=name, create=True, size=src.nbytes
             )
         except FileExistsError as e:
             print(f"Shared memory: {name} already exists")
@@ -368,12 +400,10 @@ class Parallelize(SignalEOS):
                 "You can clear the memory by doing "
                 f"multiprocessing.shared_memory.SharedMemory(name='{name}').unlink()\n"
             )
-            for d in Parallelize.shm_list:
-                multiprocessing.shared_memory.SharedMemory(name=d["name"]).unlink()
-            Parallelize.shm_list = []
+            Parallelize._release_shm()
             raise e
 
-        shm.buf[: len(bytez)] = bytez
+        shm.buf[: src.nbytes] = src
         out = {"name": name, "shm": shm, **kwargs}
         Parallelize.shm_list.append(out)
         return out
@@ -403,20 +433,7 @@ class Parallelize(SignalEOS):
                 p.worker_stop.set()
 
             # Clean up all workers
-            for p in Parallelize.instance_list:
-                if p.in_queue is not None:
-                    p.in_queue.cancel_join_thread()
-                if p.out_queue is not None:
-                    p.out_queue.cancel_join_thread()
-
-                if (
-                    p.worker is not None
-                    and hasattr(p.worker, "is_alive")
-                    and p.worker.is_alive()
-                ):
-                    p.worker.join(Parallelize.join_timeout)
-                    if hasattr(p.worker, "kill") and p.worker.is_alive():
-                        p.worker.kill()
+            Parallelize._join_workers()
             raise
 
         # Signal all workers to stop when pipeline completes normally
@@ -520,17 +537,13 @@ class _ParallelizeBase(Parallelize):
                 daemon=False,  # Ensure the thread doesn't terminate too early
             )
         else:
-            self.in_queue = QueueWrapper(
-                multiprocessing.Queue(maxsize=self.queue_maxsize)
-            )
-            self.out_queue = QueueWrapper(
-                multiprocessing.Queue(maxsize=self.queue_maxsize)
-            )
-            self.worker_stop = multiprocessing.Event()
-            self.worker_shutdown = multiprocessing.Event()
-            self.terminated = multiprocessing.Event()
-            self.worker_exception = QueueWrapper(multiprocessing.Queue(maxsize=1))
-            self.worker = multiprocessing.Process(
+            self.in_queue = QueueWrapper(_mp_context.Queue(maxsize=self.queue_maxsize))
+            self.out_queue = QueueWrapper(_mp_context.Queue(maxsize=self.queue_maxsize))
+            self.worker_stop = _mp_context.Event()
+            self.worker_shutdown = _mp_context.Event()
+            self.terminated = _mp_context.Event()
+            self.worker_exception = QueueWrapper(_mp_context.Queue(maxsize=1))
+            self.worker = _mp_context.Process(
                 target=_worker_wrapper_function,
                 args=(self.terminated, self.__class__, "worker_process"),
                 kwargs={
@@ -553,20 +566,24 @@ class _ParallelizeBase(Parallelize):
 
     def _extract_worker_parameters(self):
         """Extract parameters for worker_process method from instance attributes."""
-        # Get the signature of the worker_process method
-        sig = inspect.signature(self.worker_process)
-        extracted = {}
-
-        for param_name, param in sig.parameters.items():
-            if param_name in ("self", "context"):  # Skip special parameters
-                continue
+        # Get the (cached) signature of the worker_process method
+        cls = type(self)
+        specs = _worker_parameter_specs.get(cls)
+        if specs is None:
+            sig = inspect.signature(self.worker_process)
+            specs = tuple(
+                (param_name, param.default)
+                for param_name, param in sig.parameters.items()
+                if param_name not in ("self", "context")  # Skip special parameters
+            )
+            _worker_parameter_specs[cls] = specs
 
-            # Try to get the value from instance attributes
-            if hasattr(self, param_name):
-                extracted[param_name] = getattr(self, param_name)
-            elif param.default is not param.empty:
-                # Use default value if available
-                extracted[param_name] = param.default
+        extracted = {}
+        for param_name, default in specs:
+            # Prefer the instance attribute, falling back to the method default
+            value = getattr(self, param_name, default)
+            if value is not inspect.Parameter.empty:
+                extracted[param_name] = value
 
         return extracted
 
@@ -633,16 +650,11 @@ class _ParallelizeBase(Parallelize):
         """
         # Signal worker to finish processing pending data
         self.worker_shutdown.set()
-        start = time.time()
         out = []
 
         # Wait for worker to indicate termination
-        while True:
-            time.sleep(1)
-            if self.terminated.is_set():
-                break
-            if timeout > 0 and time.time() - start > timeout:
-                raise RuntimeError("timeout exceeded for worker shutdown")
+        if not self.terminated.wait(timeout if timeout > 0 else None):
+            raise RuntimeError("timeout exceeded for worker shutdown")
 
         # Collect any remaining output data
         if self.out_queue is not None:
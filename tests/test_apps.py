@@ -4,12 +4,14 @@ import pathlib
 import tempfile
 import asyncio
 from collections import deque
+from dataclasses import dataclass
 from unittest import mock
 
 import pytest
 
 from sgn import NullSink, NullSource
 from sgn.apps import Pipeline
+from sgn.base import SinkPad
 from sgn.sinks import DequeSink
 from sgn.sources import DequeSource
 from sgn.transforms import CallableTransform
@@ -54,9 +56,14 @@ class TestPipeline:
         with pytest.raises(AssertionError):
             p.insert(e1)
 
-        with pytest.raises(AssertionError):
+        with pytest.raises(AssertionError, match="Pad name 'src1:src:H1'"):
             p.insert(e2)
 
+        # pad names must also be unique within a single element
+        e6 = NullSource(name="src6", source_pad_names=("H1", "H1"))
+        with pytest.raises(AssertionError, match="Pad name 'src6:src:H1'"):
+            p.insert(e6)
+
         e3 = NullSink(sink_pad_names=("H1",))
         p.insert(e3)
         with pytest.raises(RuntimeError):
@@ -153,6 +160,194 @@ class TestPipeline:
 
         loop.run_until_complete(async_test_run())
 
+    def test_run_async_pads(self):
+        """Test running a pipeline with a coroutine call function."""
+
+        class AsyncSource(DequeSource):
+            async def new(self, pad):
+                await asyncio.sleep(0)
+                return super().new(pad)
+
+        p = Pipeline()
+        src = AsyncSource(
+            name="src1", source_pad_names=("H1",), iters={"H1": deque([1, 2])}
+        )
+        snk = DequeSink(name="snk1", sink_pad_names=("H1",))
+        p.connect(src, snk)
+        assert src.srcs["H1"].is_async
+        assert not snk.snks["H1"].is_async
+
+        p.run()
+        assert snk.deques["H1"] == deque([2, 1])
+
+    def test_run_async_pads_concurrently(self):
+        """Test coroutine pads in the same generation are awaited concurrently."""
+        events = []
+
+        class AsyncSink(DequeSink):
+            async def pull(self, pad, frame):
+                events.append(("start", self.name))
+                await asyncio.sleep(0)
+                events.append(("end", self.name))
+                super().pull(pad, frame)
+
+        p = Pipeline()
+        for i in (1, 2):
+            src = DequeSource(
+                name=f"src{i}", source_pad_names=("H1",), iters={"H1": deque([1])}
+            )
+            p.connect(src, AsyncSink(name=f"snk{i}", sink_pad_names=("H1",)))
+
+        p.run()
+        # both sinks start before either finishes
+        assert [event for event, _ in events[:4]] == ["start", "start", "end", "end"]
+
+    def test_run_async_pipeline_with_sync_pad_exception(self):
+        """Test errors from plain pads name the pad on the async run path."""
+
+        class AsyncSource(DequeSource):
+            async def new(self, pad):
+                return super().new(pad)
+
+        class FailingSink(DequeSink):
+            def pull(self, pad, frame):
+                raise ValueError("Intentional sync exception")
+
+        p = Pipeline()
+        src = AsyncSource(
+            name="src1", source_pad_names=("H1",), iters={"H1": deque([1])}
+        )
+        snk = FailingSink(name="snk1", sink_pad_names=("H1",))
+        p.connect(src, snk)
+
+        with pytest.raises(
+            ValueError, match=r"\(from pad 'snk1:snk:H1'\): Intentional sync"
+        ):
+            p.run()
+
+    def test_run_legacy_coroutine_pad_call(self):
+        """Test pad subclasses overriding __call__ as a coroutine are awaited."""
+
+        @dataclass(eq=False, repr=False, slots=True)
+        class LegacySinkPad(SinkPad):
+            async def __call__(self):
+                await asyncio.sleep(0)
+                self.call(self, self._get_input())
+
+        p = Pipeline()
+        src = DequeSource(
+            name="src1", source_pad_names=("H1",), iters={"H1": deque([1, 2])}
+        )
+        with mock.patch("sgn.base.SinkPad", LegacySinkPad):
+            snk = DequeSink(name="snk1", sink_pad_names=("H1",))
+        p.connect(src, snk)
+        assert snk.snks["H1"].is_async
+
+        p.run()
+        assert snk.deques["H1"] == deque([2, 1])
+
+    def test_run_async_pads_with_exception(self):
+        """Test errors from coroutine pads name the pad they came from."""
+
+        class FailingAsyncSource(DequeSource):
+            async def new(self, pad):
+                raise ValueError("Intentional async exception")
+
+        p = Pipeline()
+        src = FailingAsyncSource(
+            name="src1", source_pad_names=("H1",), iters={"H1": deque([1])}
+        )
+        snk = DequeSink(name="snk1", sink_pad_names=("H1",))
+        p.connect(src, snk)
+
+        with pytest.raises(
+            ValueError, match=r"\(from pad 'src1:src:H1'\): Intentional async"
+        ):
+            p.run()
+
+    def test_run_async_pads_while_a_running_event_loop_exist(self):
+        """Test coroutine pads are run in a thread inside a running event loop."""
+
+        class AsyncSink(DequeSink):
+            async def pull(self, pad, frame):
+                super().pull(pad, frame)
+
+        p = Pipeline()
+        src = DequeSource(
+            name="src1", source_pad_names=("H1",), iters={"H1": deque([1, 2])}
+        )
+        snk = AsyncSink(name="snk1", sink_pad_names=("H1",))
+        p.connect(src, snk)
+
+        async def async_test_run():
+            p.run()
+
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(async_test_run())
+        finally:
+            loop.close()
+        assert snk.deques["H1"] == deque([2, 1])
+
+    def test_run_sync_pads_without_event_loop(self):
+        """Test a pipeline without coroutine pads does not create an event loop."""
+        p = Pipeline()
+        src = DequeSource(
+            name="src1", source_pad_names=("H1",), iters={"H1": deque([1, 2])}
+        )
+        snk = DequeSink(name="snk1", sink_pad_names=("H1",))
+        p.connect(src, snk)
+        with mock.patch("sgn.apps.asyncio.new_event_loop") as new_event_loop:
+            p.run()
+        new_event_loop.assert_not_called()
+        assert snk.deques["H1"] == deque([2, 1])
+
+    def test_run_until_all_sinks_at_eos(self):
+        """Test the pipeline keeps running until the last sink reaches EOS."""
+        p = Pipeline()
+        src1 = DequeSource(
+            name="src1", source_pad_names=("H1",), iters={"H1": deque([1])}
+        )
+        src2 = DequeSource(
+            name="src2", source_pad_names=("H1",), iters={"H1": deque([1, 2, 3])}
+        )
+        snk1 = DequeSink(name="snk1", sink_pad_names=("H1",))
+        snk2 = DequeSink(name="snk2", sink_pad_names=("H1",))
+        p.connect(src1, snk1)
+        p.connect(src2, snk2)
+        p.run()
+        assert snk1.at_eos and snk2.at_eos
+        assert snk1.deques["H1"] == deque([1])
+        assert snk2.deques["H1"] == deque([3, 2, 1])
+
+    def test_execution_order_cache(self):
+        """Test the execution order is computed once and reset by graph changes."""
+        p = Pipeline()
+        src = DequeSource(name="src1", source_pad_names=("H1",))
+        snk = DequeSink(name="snk1", sink_pad_names=("H1",))
+        p.insert(src, snk)
+        order = p._compile_execution_order()
+        assert p._compile_execution_order() is order
+
+        p.link({snk.snks["H1"]: src.srcs["H1"]})
+        assert p._execution_order is None
+        generations = p._compile_execution_order()
+        order = [pad for generation in generations for pad in generation]
+        assert set(order) == set(p.graph) | {
+            pad for deps in p.graph.values() for pad in deps
+        }
+        assert order.index(src.srcs["H1"]) < order.index(snk.snks["H1"])
+        assert order.index(snk.snks["H1"]) < order.index(snk.internal_pad)
+
+        calls = p._compile_execution_calls()
+        assert p._compile_execution_calls() is calls
+        assert (
+            tuple(tuple(pad for pad, _, _ in generation) for generation in calls)
+            == generations
+        )
+        p.insert(NullSource(name="src2", source_pad_names=("H1",)))
+        assert p._execution_calls is None
+
 
 class TestPipelineGraphviz:
     """Test group for Pipeline class with graphviz."""
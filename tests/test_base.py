@@ -9,6 +9,7 @@ import pytest
 from sgn.base import (
     ElementLike,
     Frame,
+    InternalPad,
     SinkElement,
     SinkPad,
     SourceElement,
@@ -44,7 +45,8 @@ class TestUniqueID:
     def test_hash(self):
         """Test the __hash__ method."""
         ui = UniqueID()
-        assert hash(ui) == hash(ui._id)
+        assert hash(ui) == object.__hash__(ui)
+        assert {ui: 1}[ui] == 1
 
     def test_eq(self):
         """Test the __eq__ method."""
@@ -52,6 +54,7 @@ class TestUniqueID:
         ui2 = UniqueID()
         assert ui1 == ui1
         assert ui1 != ui2
+        assert ui1._id != ui2._id
 
 
 class TestSinkPadDataSpecValidation:
@@ -80,17 +83,17 @@ class TestSinkPadDataSpecValidation:
         p2.link(p1)
 
         # Run correct order first time - should succeed
-        asyncio_run(p1())
-        asyncio_run(p2())
+        p1()
+        p2()
         assert p2.input is not None
         assert p2.data_spec is not None
 
         # Run again, data specification will be different
-        asyncio_run(p1())
+        p1()
         with pytest.raises(
             ValueError, match="inconsistent with previously received frames"
         ):
-            asyncio_run(p2())
+            p2()
 
     def test_data_spec_initial_set(self):
         """Test that SinkPad sets data_spec on first call."""
@@ -113,8 +116,8 @@ class TestSinkPadDataSpecValidation:
 
         # Link and run
         p2.link(p1)
-        asyncio_run(p1())
-        asyncio_run(p2())
+        p1()
+        p2()
 
         # Now data_spec should be set
         assert p2.data_spec == RateDataSpec(rate=100)
@@ -128,7 +131,7 @@ class TestSinkPadDataSpecValidation:
 
         # Try running before linking (bad)
         with pytest.raises(AssertionError, match="Sink pad has not been linked"):
-            asyncio_run(p2())
+            p2()
 
     def test_sink_pad_call_wrong_order(self):
         """Test that calling SinkPad before SourcePad raises AssertionError."""
@@ -151,7 +154,7 @@ class TestSinkPadDataSpecValidation:
 
         # Run wrong order (sink before source has output)
         with pytest.raises(AssertionError):
-            asyncio_run(p2())
+            p2()
 
     def test_sink_pad_link_wrong_type(self):
         """Test that linking a sink pad to non-SourcePad raises AssertionError."""
@@ -172,6 +175,61 @@ class TestSinkPadDataSpecValidation:
         res = s2.link(s1)
         assert s2.other == s1
         assert res == {s2: {s1}}
+        assert isinstance(res[s2], frozenset)
+
+
+class TestAsyncPads:
+    """Test group for pads with coroutine call functions."""
+
+    def test_sync_call_not_async(self):
+        """Test that pads with plain call functions are not marked async."""
+        mock_element = ElementLike(name="mock")
+        p1 = SourcePad(name="testsrc", element=mock_element, call=lambda pad: Frame())
+        assert not p1.is_async
+        assert not mock_element.internal_pad.is_async
+
+    def test_async_call(self):
+        """Test that coroutine call functions are detected and awaited."""
+        received = []
+
+        async def async_src(pad):
+            return Frame(data=1)
+
+        async def async_snk(pad, frame):
+            received.append(frame.data)
+
+        async def async_internal():
+            received.append("internal")
+
+        mock_element = ElementLike(name="mock")
+        p1 = SourcePad(name="testsrc", element=mock_element, call=async_src)
+        p2 = SinkPad(name="testsink", element=mock_element, call=async_snk)
+        p3 = InternalPad(name="testinl", element=mock_element, call=async_internal)
+        assert p1.is_async and p2.is_async and p3.is_async
+
+        p2.link(p1)
+        asyncio_run(p1.call_async())
+        asyncio_run(p2.call_async())
+        asyncio_run(p3.call_async())
+        assert p1.output.data == 1
+        assert received == [1, "internal"]
+
+    def test_coroutine_call_override(self):
+        """Test that pads overriding __call__ as a coroutine are marked async."""
+
+        @dataclass(eq=False, repr=False, slots=True)
+        class LegacySourcePad(SourcePad):
+            async def __call__(self):
+                self.output = self.call(pad=self)
+
+        mock_element = ElementLike(name="mock")
+        p1 = LegacySourcePad(
+            name="testsrc", element=mock_element, call=lambda pad: Frame(data=1)
+        )
+        assert p1.is_async
+
+        asyncio_run(p1())
+        assert p1.output.data == 1
 
 
 class TestElementLikeProperties:
@@ -184,6 +242,7 @@ class TestElementLikeProperties:
         el = ElementLike(name="element", source_pads=[src])
 
         pad_dict = el.source_pad_dict
+        assert el.source_pad_dict is pad_dict
         # The pad name will be formatted as "element:src:testsrc"
         assert len(pad_dict) == 1
         assert src in pad_dict.values()
@@ -196,6 +255,7 @@ class TestElementLikeProperties:
         el = ElementLike(name="element", sink_pads=[snk])
 
         pad_dict = el.sink_pad_dict
+        assert el.sink_pad_dict is pad_dict
         # The pad name will be formatted as "element:snk:testsink"
         assert len(pad_dict) == 1
         assert snk in pad_dict.values()
@@ -210,6 +270,7 @@ class TestElementLikeProperties:
 
         # Pad list will have source pads, sink pads, and internal pad
         pad_list = el.pad_list
+        assert el.pad_list is pad_list
         assert len(pad_list) == 3
         assert src in pad_list
         assert snk in pad_list
@@ -223,6 +284,7 @@ class TestElementLikeProperties:
 
         # Logger should be scoped to the element name
         assert logger.name == "sgn.test_element"
+        assert el.logger is logger
 
 
 class TestSourceElement:
@@ -364,7 +426,7 @@ class TestSinkElement:
         assert snk.sink_pads[1] in snk.rsnks
 
         # Check EOS tracking
-        assert all(not eos for eos in snk._at_eos.values())
+        assert snk._eos_mask == 0
         assert not snk.at_eos
 
         # Check sink_pad_names_full
@@ -398,11 +460,11 @@ class TestSinkElement:
 
         # Mark one pad as EOS
         snk.mark_eos(snk.sink_pads[0])
-        assert snk._at_eos[snk.sink_pads[0]]
+        assert snk._eos_mask >> snk._eos_idx[snk.sink_pads[0]] & 1
         assert snk.at_eos  # Should propagate
 
         # Other pad still not at EOS
-        assert not snk._at_eos[snk.sink_pads[1]]
+        assert not snk._eos_mask >> snk._eos_idx[snk.sink_pads[1]] & 1
 
     def test_sink_element_at_eos_property(self):
         """Test SinkElement at_eos property returns True if any pad is at EOS."""
@@ -417,9 +479,9 @@ class TestSinkElement:
         assert not snk.at_eos
 
         # Mark one pad
-        snk._at_eos[snk.sink_pads[0]] = True
+        snk.mark_eos(snk.sink_pads[0])
         assert snk.at_eos
 
         # Mark both pads
-        snk._at_eos[snk.sink_pads[1]] = True
+        snk.mark_eos(snk.sink_pads[1])
         assert snk.at_eos
@@ -20,6 +20,14 @@ class TestFrame:
         assert not f.EOS
         assert not f.is_gap
         assert f.data is None
+        assert f.spec == DataSpec()
+        assert f.metadata == {}
+
+    def test_default_spec_shared(self):
+        """Test frames share the default spec but not the default metadata."""
+        f1, f2 = Frame(), Frame()
+        assert f1.spec is f2.spec
+        assert f1.metadata is not f2.metadata
 
 
 class TestIterFrame:
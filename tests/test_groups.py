@@ -15,6 +15,7 @@ def test_pad_selection_creation():
 
     assert selection.element is src
     assert selection.pad_names == {"H1", "L1"}
+    assert isinstance(selection.pad_names, frozenset)
 
 
 def test_pad_selection_validation():
@@ -40,6 +41,7 @@ def test_pad_selection_srcs():
     assert "H1" in srcs
     assert "V1" in srcs
     assert "L1" not in srcs  # Not selected
+    assert selection.srcs is srcs  # Filtered once at construction
 
     # Verify these are actual SourcePad objects
     assert srcs["H1"] is src.srcs["H1"]
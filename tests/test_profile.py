@@ -20,3 +20,34 @@ def test_mem_prof(monkeypatch):
     p.insert(e1, e2, link_map={e2.snks["H1"]: e1.srcs["H1"]})
     p.run()
     monkeypatch.delenv("SGNLOGLEVEL")
+
+
+def test_mem_prof_async(monkeypatch):
+    monkeypatch.setenv("SGNLOGLEVEL", "pipeline:MEMPROF")
+    import sgn
+    import sgn.apps
+    import sgn.profile
+    import importlib
+
+    importlib.reload(sgn)
+    importlib.reload(sgn.apps)
+    importlib.reload(sgn.profile)
+    import tracemalloc
+
+    from sgn import NullSink, NullSource
+    from sgn.apps import Pipeline
+
+    # start from a clean state so the async wrapper starts tracing itself
+    tracemalloc.stop()
+
+    class AsyncNullSink(NullSink):
+        async def pull(self, pad, frame):
+            super().pull(pad, frame)
+
+    p = Pipeline()
+    e1 = NullSource(name="src1", source_pad_names=("H1",), num_frames=2)
+    e2 = AsyncNullSink(sink_pad_names=("H1",))
+    p.insert(e1, e2, link_map={e2.snks["H1"]: e1.srcs["H1"]})
+    assert e2.snks["H1"].is_async
+    p.run()
+    monkeypatch.delenv("SGNLOGLEVEL")
@@ -124,4 +124,4 @@ class TestDeqSink:
         sink = DequeSink(name="snk1", sink_pad_names=("I1", "I2"))
         frame = Frame(EOS=True)
         sink.pull(sink.sink_pads[0], frame)
-        assert sink._at_eos[sink.sink_pads[0]]
+        assert sink._eos_mask >> sink._eos_idx[sink.sink_pads[0]] & 1
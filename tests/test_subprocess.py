@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import time
+import array
 import multiprocessing
 import pytest
 import threading
@@ -10,6 +11,7 @@ import ctypes
 import queue
 from dataclasses import dataclass
 from queue import Empty
+from unittest import mock
 
 from sgn.sinks import NullSink
 from sgn.sources import SignalEOS
@@ -539,6 +541,44 @@ def test_subprocess_exit_kill():
         Parallelize.instance_list = original_instances
 
 
+def test_subprocess_exit_shared_join_deadline(monkeypatch):
+    """Test that __exit__ gives all workers one join deadline, not one each."""
+    monkeypatch.setattr(Parallelize, "join_timeout", 0.2)
+    join_timeouts = []
+
+    class HungWorker:
+        def __init__(self):
+            self.alive = True
+
+        def is_alive(self):
+            return self.alive
+
+        def start(self):
+            pass
+
+        def join(self, timeout):
+            join_timeouts.append(timeout)
+            time.sleep(timeout)
+
+        def kill(self):
+            self.alive = False
+
+    class StubInstance:
+        def __init__(self):
+            self.worker = HungWorker()
+            self.in_queue = None
+            self.out_queue = None
+
+    instances = [StubInstance(), StubInstance()]
+    Parallelize.instance_list = list(instances)
+
+    with Parallelize(Pipeline()):
+        pass
+
+    assert sum(join_timeouts) <= Parallelize.join_timeout
+    assert not any(i.worker.alive for i in instances)
+
+
 def test_subprocess_run_exception():
     """Test that the run method properly handles exceptions in the pipeline."""
 
@@ -882,6 +922,48 @@ def test_subprocess_to_shm_duplicate():
     Parallelize.shm_list = []
 
 
+def test_subprocess_to_shm_multibyte_buffer():
+    """Test that to_shm sizes and copies buffers by their byte count."""
+    test_data = array.array("d", [1.0, 2.0, 3.0])
+    out = Parallelize.to_shm("test_multibyte", test_data)
+    try:
+        assert out["shm"].buf[: len(test_data.tobytes())] == test_data.tobytes()
+    finally:
+        out["shm"].close()
+        out["shm"].unlink()
+        Parallelize.shm_list = []
+
+
+def test_subprocess_release_shm_with_exported_view():
+    """Test that teardown unlinks every segment even while a view is held."""
+    first = Parallelize.to_shm("test_release_view", bytearray(b"held"))
+    second = Parallelize.to_shm("test_release_other", bytearray(b"free"))
+    view = first["shm"].buf[:4]
+    try:
+        with Parallelize(Pipeline()):
+            pass
+
+        assert Parallelize.shm_list == []
+        for name in ("test_release_view", "test_release_other"):
+            with pytest.raises(FileNotFoundError):
+                multiprocessing.shared_memory.SharedMemory(name=name)
+    finally:
+        view.release()
+        first["shm"].close()
+        second["shm"].close()
+
+
+def test_subprocess_release_shm_already_unlinked():
+    """Test that teardown tolerates segments that were unlinked elsewhere."""
+    out = Parallelize.to_shm("test_release_unlinked", bytearray(b"gone"))
+    out["shm"].unlink()
+
+    with Parallelize(Pipeline()):
+        pass
+
+    assert Parallelize.shm_list == []
+
+
 #
 # Tests for concurrency modes
 #
@@ -1338,5 +1420,32 @@ def test_get_worker_exception_pipeline():
     ), "Original ValueError should be preserved in exception chain"
 
 
+def test_parameter_extraction_is_cached_per_class():
+    """Test that the worker_process signature is inspected once per class."""
+
+    @dataclass
+    class CachedParamElement(ParallelizeTransformElement):
+        multiplier: int = 2
+
+        def new(self, pad):
+            return Frame()
+
+        def pull(self, pad, frame):
+            pass
+
+        @staticmethod
+        def worker_process(context: WorkerContext, multiplier: int) -> None:
+            pass
+
+    first = CachedParamElement(sink_pad_names=("in",), source_pad_names=("out",))
+    with mock.patch("sgn.subprocess.inspect.signature") as signature:
+        second = CachedParamElement(
+            multiplier=5, sink_pad_names=("in",), source_pad_names=("out",)
+        )
+    signature.assert_not_called()
+    assert first._extract_worker_parameters() == {"multiplier": 2}
+    assert second._extract_worker_parameters() == {"multiplier": 5}
+
+
 if __name__ == "__main__":
     test_subprocess()